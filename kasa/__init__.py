@@ -12,11 +12,13 @@ Module-specific errors are raised as `KasaException` and are expected
 to be handled by the user of the library.
 """
 
-from importlib.metadata import version
+from __future__ import annotations
+
+import os
+from importlib import import_module
 from typing import TYPE_CHECKING
 from warnings import warn
 
-from kasa.bulb import Bulb
 from kasa.credentials import Credentials
 from kasa.device import Device
 from kasa.device_type import DeviceType
@@ -26,7 +28,6 @@ from kasa.deviceconfig import (
     DeviceFamilyType,
     EncryptType,
 )
-from kasa.discover import Discover
 from kasa.emeterstatus import EmeterStatus
 from kasa.exceptions import (
     AuthenticationError,
@@ -36,17 +37,11 @@ from kasa.exceptions import (
     UnsupportedDeviceError,
 )
 from kasa.feature import Feature, FeatureType
-from kasa.iot.iotbulb import BulbPreset, TurnOnBehavior, TurnOnBehaviors
 from kasa.iotprotocol import (
     IotProtocol,
     _deprecated_TPLinkSmartHomeProtocol,  # noqa: F401
 )
-from kasa.plug import Plug
 from kasa.protocol import BaseProtocol
-from kasa.smartprotocol import SmartProtocol
-
-__version__ = version("python-kasa")
-
 
 __all__ = [
     "Discover",
@@ -75,17 +70,31 @@ __all__ = [
     "DeviceFamilyType",
 ]
 
-from . import iot
+# Names pulling in modules not already loaded by kasa.device are imported
+# on first access to keep `import kasa` cheap.
+_LAZY_ATTRS = {
+    "Discover": "kasa.discover",
+    "SmartProtocol": "kasa.smartprotocol",
+    "Bulb": "kasa.bulb",
+    "Plug": "kasa.plug",
+    "BulbPreset": "kasa.bulb",
+    "TurnOnBehavior": "kasa.iot.iotbulb",
+    "TurnOnBehaviors": "kasa.iot.iotbulb",
+}
+_LAZY_SUBMODULES = ["iot", "smart"]
+_LAZY_NAMES = ["__version__", *_LAZY_ATTRS, *_LAZY_SUBMODULES]
 
 deprecated_names = ["TPLinkSmartHomeProtocol"]
+# Deprecated device classes are given as (defining module, class name) pairs
+# so that looking them up does not require importing the iot package.
 deprecated_smart_devices = {
-    "SmartDevice": iot.IotDevice,
-    "SmartPlug": iot.IotPlug,
-    "SmartBulb": iot.IotBulb,
-    "SmartLightStrip": iot.IotLightStrip,
-    "SmartStrip": iot.IotStrip,
-    "SmartDimmer": iot.IotDimmer,
-    "SmartBulbPreset": BulbPreset,
+    "SmartDevice": ("kasa.iot.iotdevice", "IotDevice"),
+    "SmartPlug": ("kasa.iot.iotplug", "IotPlug"),
+    "SmartBulb": ("kasa.iot.iotbulb", "IotBulb"),
+    "SmartLightStrip": ("kasa.iot.iotlightstrip", "IotLightStrip"),
+    "SmartStrip": ("kasa.iot.iotstrip", "IotStrip"),
+    "SmartDimmer": ("kasa.iot.iotdimmer", "IotDimmer"),
+    "SmartBulbPreset": ("kasa.bulb", "BulbPreset"),
 }
 deprecated_exceptions = {
     "SmartDeviceException": KasaException,
@@ -94,31 +103,74 @@ deprecated_exceptions = {
     "TimeoutException": TimeoutError,
 }
 
+# All deprecated names mapped to (module, attribute, warning message)
+_DEPRECATED: dict[str, tuple[str, str, str]] = {}
+for _name in deprecated_names:
+    _DEPRECATED[_name] = (__name__, f"_deprecated_{_name}", f"{_name} is deprecated")
+for _name, (_module, _class_name) in deprecated_smart_devices.items():
+    _package_name = _module.rpartition(".")[0]
+    _DEPRECATED[_name] = (
+        _module,
+        _class_name,
+        f"{_name} is deprecated, use {_class_name} "
+        + f"from package {_package_name} instead or use Discover.discover_single()"
+        + " and Device.connect() to support new protocols",
+    )
+for _name, _class in deprecated_exceptions.items():
+    _DEPRECATED[_name] = (
+        _class.__module__,
+        _class.__name__,
+        f"{_name} is deprecated, use {_class.__name__} instead",
+    )
+del _name, _module, _class_name, _package_name, _class
+
 
 def __getattr__(name):
-    if name in deprecated_names:
-        warn(f"{name} is deprecated", DeprecationWarning, stacklevel=1)
-        return globals()[f"_deprecated_{name}"]
-    if name in deprecated_smart_devices:
-        new_class = deprecated_smart_devices[name]
-        package_name = ".".join(new_class.__module__.split(".")[:-1])
-        warn(
-            f"{name} is deprecated, use {new_class.__name__} "
-            + f"from package {package_name} instead or use Discover.discover_single()"
-            + " and Device.connect() to support new protocols",
-            DeprecationWarning,
-            stacklevel=1,
-        )
-        return new_class
-    if name in deprecated_exceptions:
-        new_class = deprecated_exceptions[name]
-        msg = f"{name} is deprecated, use {new_class.__name__} instead"
+    if (deprecated := _DEPRECATED.get(name)) is not None:
+        module_path, attr, msg = deprecated
+        obj = getattr(import_module(module_path), attr)
         warn(msg, DeprecationWarning, stacklevel=1)
-        return new_class
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    elif (module_path := _LAZY_ATTRS.get(name)) is not None:
+        obj = getattr(import_module(module_path), name)
+    elif name in _LAZY_SUBMODULES:
+        obj = import_module(f"{__name__}.{name}")
+    elif name == "__version__":
+        # Looking up the distribution metadata is slow, only do it when needed
+        from importlib.metadata import version
+
+        obj = version("python-kasa")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the result so that later lookups never reach __getattr__,
+    # which also means deprecation warnings are only emitted once.
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, *_LAZY_NAMES})
+
+
+# Resolve all lazy names at import time, e.g. so that CI fails fast when
+# one of the lazy import targets is broken.
+if os.environ.get("KASA_EAGER_IMPORT") == "1":
+    for _name in [*_LAZY_ATTRS, *_LAZY_SUBMODULES]:
+        __getattr__(_name)
+    del _name
 
 
 if TYPE_CHECKING:
+    from kasa.bulb import Bulb, BulbPreset
+    from kasa.discover import Discover
+    from kasa.iot.iotbulb import TurnOnBehavior, TurnOnBehaviors
+    from kasa.plug import Plug
+    from kasa.smartprotocol import SmartProtocol
+
+    from . import iot, smart  # noqa: F401
+
+    __version__: str
+
     SmartDevice = Device
     SmartBulb = iot.IotBulb
     SmartPlug = iot.IotPlug
@@ -131,14 +183,3 @@ if TYPE_CHECKING:
     UnsupportedDeviceException = UnsupportedDeviceError
     AuthenticationException = AuthenticationError
     TimeoutException = TimeoutError
-    # Instanstiate all classes so the type checkers catch abstract issues
-    from . import smart
-
-    smart.SmartDevice("127.0.0.1")
-    smart.SmartBulb("127.0.0.1")
-    iot.IotDevice("127.0.0.1")
-    iot.IotPlug("127.0.0.1")
-    iot.IotBulb("127.0.0.1")
-    iot.IotLightStrip("127.0.0.1")
-    iot.IotStrip("127.0.0.1")
-    iot.IotDimmer("127.0.0.1")
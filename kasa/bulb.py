@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import NamedTuple, Optional
+from typing import NamedTuple, Optional, Sequence
 
 from .device import Device
 
@@ -48,7 +48,8 @@ class BulbPreset(BaseModel):
 class Bulb(Device, ABC):
     """Base class for TP-Link Bulb."""
 
-    def _raise_for_invalid_brightness(self, value):
+    @staticmethod
+    def _raise_for_invalid_brightness(value):
         if not isinstance(value, int) or not (0 <= value <= 100):
             raise ValueError(f"Invalid brightness value: {value} (valid range: 0-100%)")
 
@@ -143,5 +144,5 @@ class Bulb(Device, ABC):
 
     @property
     @abstractmethod
-    def presets(self) -> list[BulbPreset]:
+    def presets(self) -> Sequence[BulbPreset]:
         """Return a list of available bulb setting presets."""
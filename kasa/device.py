@@ -142,6 +142,9 @@ class Device(ABC):
         """
         self.protocol._transport._host = value
         self.protocol._transport._config.host = value
+        for device in (self, *self.children):
+            for module in device.modules.values():
+                module._invalidate_repr()
 
     @property
     def port(self) -> int:
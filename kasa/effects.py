@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import cast
+import sys
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Any, Mapping, cast
 
 EFFECT_AURORA = {
     "custom": 0,
@@ -294,5 +297,12 @@ EFFECTS_LIST_V1 = [
     EFFECT_VALENTINES,
 ]
 
-EFFECT_NAMES_V1: list[str] = [cast(str, effect["name"]) for effect in EFFECTS_LIST_V1]
-EFFECT_MAPPING_V1 = {effect["name"]: effect for effect in EFFECTS_LIST_V1}
+EFFECT_NAMES_V1: tuple[str, ...] = tuple(
+    sys.intern(cast(str, effect["name"])) for effect in EFFECTS_LIST_V1
+)
+# Read-only views over private copies, so that modifying the exported
+# EFFECT_* dicts or EFFECTS_LIST_V1 does not change the built-in definitions
+EFFECT_MAPPING_V1: dict[str, Mapping[str, Any]] = {
+    name: MappingProxyType(deepcopy(effect))
+    for name, effect in zip(EFFECT_NAMES_V1, EFFECTS_LIST_V1)
+}
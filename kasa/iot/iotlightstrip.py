@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from ..device_type import DeviceType
 from ..deviceconfig import DeviceConfig
 from ..effects import EFFECT_MAPPING_V1, EFFECT_NAMES_V1
@@ -31,7 +34,7 @@ class IotLightStrip(IotBulb):
 
         Currently active effect:
 
-        >>> strip.effect
+        >>> dict(strip.effect)
         {'brightness': 50, 'custom': 0, 'enable': 0, 'id': '', 'name': ''}
 
     .. note::
@@ -54,6 +57,8 @@ class IotLightStrip(IotBulb):
     ) -> None:
         super().__init__(host=host, config=config, protocol=protocol)
         self._device_type = DeviceType.LightStrip
+        # (source lighting_effect_state, read-only view of it)
+        self._effect_view: tuple[dict[str, Any], Mapping[str, Any]] | None = None
 
     @property  # type: ignore
     @requires_update
@@ -63,9 +68,12 @@ class IotLightStrip(IotBulb):
 
     @property  # type: ignore
     @requires_update
-    def effect(self) -> dict:
+    def effect(self) -> Mapping[str, Any]:
         """Return effect state.
 
+        The returned mapping is a read-only view of the device state,
+        use ``dict(strip.effect)`` to get a mutable copy.
+
         Example:
             {'brightness': 50,
              'custom': 0,
@@ -73,15 +81,19 @@ class IotLightStrip(IotBulb):
              'id': '',
              'name': ''}
         """
-        return self.sys_info["lighting_effect_state"]
+        state = self.sys_info["lighting_effect_state"]
+        view = self._effect_view
+        if view is None or view[0] is not state:
+            view = self._effect_view = (state, MappingProxyType(state))
+        return view[1]
 
     @property  # type: ignore
     @requires_update
-    def effect_list(self) -> list[str] | None:
+    def effect_list(self) -> tuple[str, ...] | None:
         """Return built-in effects list.
 
         Example:
-            ['Aurora', 'Bubbling Cauldron', ...]
+            ('Aurora', 'Bubbling Cauldron', ...)
         """
         return EFFECT_NAMES_V1 if self.has_effects else None
 
@@ -107,7 +119,7 @@ class IotLightStrip(IotBulb):
         """
         if effect not in EFFECT_MAPPING_V1:
             raise KasaException(f"The effect {effect} is not a built in effect.")
-        effect_dict = EFFECT_MAPPING_V1[effect]
+        effect_dict = {**EFFECT_MAPPING_V1[effect]}
         if brightness is not None:
             effect_dict["brightness"] = brightness
         if transition is not None:
@@ -23,6 +23,8 @@ def merge(d, u):
 class IotModule(Module):
     """Base class implemention for all IOT modules."""
 
+    __slots__ = ()
+
     def call(self, method, params=None):
         """Call the given method with the given parameters."""
         return self._device._query_helper(self._module, method, params)
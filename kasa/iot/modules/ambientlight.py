@@ -16,6 +16,8 @@ from ..iotmodule import IotModule, merge
 class AmbientLight(IotModule):
     """Implements ambient light controls for the motion sensor."""
 
+    __slots__ = ()
+
     def __init__(self, device, module):
         super().__init__(device, module)
         self._add_feature(
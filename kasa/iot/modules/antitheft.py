@@ -8,3 +8,5 @@ class Antitheft(RuleModule):
 
     This shares the functionality among other rule-based modules.
     """
+
+    __slots__ = ()
@@ -27,6 +27,8 @@ class CloudInfo(BaseModel):
 class Cloud(IotModule):
     """Module implementing support for cloud services."""
 
+    __slots__ = ()
+
     def __init__(self, device, module):
         super().__init__(device, module)
         self._add_feature(
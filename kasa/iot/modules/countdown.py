@@ -5,3 +5,5 @@ from .rulemodule import RuleModule
 
 class Countdown(RuleModule):
     """Implementation of countdown module."""
+
+    __slots__ = ()
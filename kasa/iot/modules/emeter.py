@@ -11,6 +11,8 @@ from .usage import Usage
 class Emeter(Usage):
     """Emeter module."""
 
+    __slots__ = ()
+
     @property  # type: ignore
     def realtime(self) -> EmeterStatus:
         """Return current energy readings."""
@@ -19,18 +21,26 @@ class Emeter(Usage):
     @property
     def emeter_today(self) -> float | None:
         """Return today's energy consumption in kWh."""
-        raw_data = self.daily_data
-        today = datetime.now().day
-        data = self._convert_stat_data(raw_data, entry_key="day", key=today)
-        return data.get(today)
+        day = datetime.now().day
+        return self._get_stat_value(self.daily_data, entry_key="day", key=day)
 
     @property
     def emeter_this_month(self) -> float | None:
         """Return this month's energy consumption in kWh."""
-        raw_data = self.monthly_data
-        current_month = datetime.now().month
-        data = self._convert_stat_data(raw_data, entry_key="month", key=current_month)
-        return data.get(current_month)
+        month = datetime.now().month
+        return self._get_stat_value(self.monthly_data, entry_key="month", key=month)
+
+    @property
+    def emeter_today_and_month(self) -> tuple[float | None, float | None]:
+        """Return today's and this month's energy consumption in kWh.
+
+        Reads the clock only once, use this when both values are needed.
+        """
+        now = datetime.now()
+        return (
+            self._get_stat_value(self.daily_data, entry_key="day", key=now.day),
+            self._get_stat_value(self.monthly_data, entry_key="month", key=now.month),
+        )
 
     async def erase_stats(self):
         """Erase all stats.
@@ -61,12 +71,20 @@ class Emeter(Usage):
         data = self._convert_stat_data(data["month_list"], entry_key="month", kwh=kwh)
         return data
 
+    @staticmethod
+    def _get_value_key_and_scale(
+        data: list[dict[str, int | float]], kwh: bool
+    ) -> tuple[str, float]:
+        """Return the energy key used by the device and the scale to apply."""
+        if "energy_wh" in data[0]:
+            return "energy_wh", 1 / 1000 if kwh else 1
+        return "energy", 1 if kwh else 1000
+
     def _convert_stat_data(
         self,
         data: list[dict[str, int | float]],
         entry_key: str,
         kwh: bool = True,
-        key: int | None = None,
     ) -> dict[int | float, int | float]:
         """Return emeter information keyed with the day/month.
 
@@ -84,30 +102,46 @@ class Emeter(Usage):
         if not data:
             return {}
 
-        scale: float = 1
+        value_key, scale = self._get_value_key_and_scale(data, kwh)
+        if scale == 1:
+            return {entry[entry_key]: entry[value_key] for entry in data}
 
-        if "energy_wh" in data[0]:
-            value_key = "energy_wh"
-            if kwh:
-                scale = 1 / 1000
-        else:
-            value_key = "energy"
-            if not kwh:
-                scale = 1000
-
-        if key is None:
-            # Return all the data
-            return {entry[entry_key]: entry[value_key] * scale for entry in data}
-
-        # In this case we want a specific key in the data
-        # i.e. the current day or month.
-        #
-        # Since we usually want the data at the end of the list so we can
-        # optimize the search by starting at the end and avoid scaling
-        # the data we don't need.
-        #
+        return {entry[entry_key]: entry[value_key] * scale for entry in data}
+
+    def _get_stat_value(
+        self,
+        data: list[dict[str, int | float]],
+        entry_key: str,
+        key: int,
+        kwh: bool = True,
+    ) -> int | float | None:
+        """Return the energy of a single day/month entry, or None if missing."""
+        entry = self._find_entry(data, entry_key, key)
+        if entry is None:
+            return None
+
+        value_key, scale = self._get_value_key_and_scale(data, kwh)
+        value = entry[value_key]
+        return value if scale == 1 else value * scale
+
+    @staticmethod
+    def _find_entry(
+        data: list[dict[str, int | float]], entry_key: str, key: int
+    ) -> dict[str, int | float] | None:
+        """Return the entry for the given day/month, or None if missing."""
+        if not data:
+            return None
+
+        # The devices report the entries in ascending order, so when there
+        # are no gaps in the list the wanted entry is found directly by offset.
+        idx = key - int(data[0][entry_key])
+        if 0 <= idx < len(data) and data[idx][entry_key] == key:
+            return data[idx]
+
+        # Otherwise search from the end, as we usually want the data
+        # for the current day or month.
         for entry in reversed(data):
             if entry[entry_key] == key:
-                return {entry[entry_key]: entry[value_key] * scale}
+                return entry
 
-        return {}
+        return None
@@ -25,6 +25,8 @@ class Range(Enum):
 class Motion(IotModule):
     """Implements the motion detection (PIR) module."""
 
+    __slots__ = ()
+
     def query(self):
         """Request PIR configuration."""
         return self.query_for_command("get_config")
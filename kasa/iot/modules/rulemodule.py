@@ -61,6 +61,8 @@ _LOGGER = logging.getLogger(__name__)
 class RuleModule(IotModule):
     """Base class for rule-based modules, such as countdown and antitheft."""
 
+    __slots__ = ()
+
     def query(self):
         """Prepare the query for rules."""
         q = self.query_for_command("get_rules")
@@ -5,3 +5,5 @@ from .rulemodule import RuleModule
 
 class Schedule(RuleModule):
     """Implements the scheduling interface."""
+
+    __slots__ = ()
@@ -9,6 +9,8 @@ from ..iotmodule import IotModule, merge
 class Time(IotModule):
     """Implements the timezone settings."""
 
+    __slots__ = ()
+
     def query(self):
         """Request time and timezone."""
         q = self.query_for_command("get_time")
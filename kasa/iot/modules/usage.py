@@ -10,6 +10,8 @@ from ..iotmodule import IotModule, merge
 class Usage(IotModule):
     """Baseclass for emeter/usage interfaces."""
 
+    __slots__ = ()
+
     def query(self):
         """Return the base query."""
         now = datetime.now()
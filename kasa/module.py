@@ -11,6 +11,12 @@ from .feature import Feature
 
 _LOGGER = logging.getLogger(__name__)
 
+_SLUG_TABLE = str.maketrans({" ": "_", "'": "_"})
+
+
+def _slugified_name(name: str) -> str:
+    return name.translate(_SLUG_TABLE).lower()
+
 
 class Module(ABC):
     """Base class implemention for all modules.
@@ -19,10 +25,13 @@ class Module(ABC):
     executed during the regular update cycle.
     """
 
+    __slots__ = ("_device", "_module", "_module_features", "_repr")
+
     def __init__(self, device: Device, module: str):
         self._device = device
         self._module = module
         self._module_features: dict[str, Feature] = {}
+        self._repr: str | None = None
 
     @abstractmethod
     def query(self):
@@ -39,17 +48,19 @@ class Module(ABC):
 
     def _add_feature(self, feature: Feature):
         """Add module feature."""
-
-        def _slugified_name(name):
-            return name.lower().replace(" ", "_").replace("'", "_")
-
         feat_name = _slugified_name(feature.name)
         if feat_name in self._module_features:
-            raise KasaException("Duplicate name detected %s" % feat_name)
+            raise KasaException(f"Duplicate name detected {feat_name}")
         self._module_features[feat_name] = feature
 
+    def _invalidate_repr(self):
+        """Clear the cached representation, e.g., after the host has changed."""
+        self._repr = None
+
     def __repr__(self) -> str:
-        return (
-            f"<Module {self.__class__.__name__} ({self._module})"
-            f" for {self._device.host}>"
-        )
+        if self._repr is None:
+            self._repr = (
+                f"<Module {self.__class__.__name__} ({self._module})"
+                f" for {self._device.host}>"
+            )
+        return self._repr
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class AlarmModule(SmartModule):
     """Implementation of alarm module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "alarm"
 
     def query(self) -> dict:
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class AutoOffModule(SmartModule):
     """Implementation of auto off module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "auto_off"
     QUERY_GETTER_NAME = "get_auto_off_config"
 
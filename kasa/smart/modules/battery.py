@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class BatterySensor(SmartModule):
     """Implementation of battery module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "battery_detect"
     QUERY_GETTER_NAME = "get_battery_detect_info"
 
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class Brightness(SmartModule):
     """Implementation of brightness module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "brightness"
 
     def __init__(self, device: SmartDevice, module: str):
@@ -6,5 +6,7 @@ from ..smartmodule import SmartModule
 class ChildDeviceModule(SmartModule):
     """Implementation for child devices."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "child_device"
     QUERY_GETTER_NAME = "get_child_device_list"
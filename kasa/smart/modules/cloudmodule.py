@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class CloudModule(SmartModule):
     """Implementation of cloud module."""
 
+    __slots__ = ()
+
     QUERY_GETTER_NAME = "get_connect_cloud_state"
     REQUIRED_COMPONENT = "cloud_connect"
 
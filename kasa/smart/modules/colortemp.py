@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class ColorTemperatureModule(SmartModule):
     """Implementation of color temp module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "color_temperature"
 
     def __init__(self, device: SmartDevice, module: str):
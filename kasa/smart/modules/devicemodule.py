@@ -8,6 +8,8 @@ from ..smartmodule import SmartModule
 class DeviceModule(SmartModule):
     """Implementation of device module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "device"
 
     def query(self) -> dict:
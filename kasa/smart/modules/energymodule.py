@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class EnergyModule(SmartModule):
     """Implementation of energy monitoring module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "energy_monitoring"
 
     def __init__(self, device: SmartDevice, module: str):
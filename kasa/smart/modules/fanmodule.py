@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class FanModule(SmartModule):
     """Implementation of fan_control module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "fan_control"
 
     def __init__(self, device: SmartDevice, module: str):
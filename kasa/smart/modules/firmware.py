@@ -47,6 +47,8 @@ class UpdateInfo(BaseModel):
 class Firmware(SmartModule):
     """Implementation of firmware module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "firmware"
 
     def __init__(self, device: SmartDevice, module: str):
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class HumiditySensor(SmartModule):
     """Implementation of humidity module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "humidity"
     QUERY_GETTER_NAME = "get_comfort_humidity_config"
 
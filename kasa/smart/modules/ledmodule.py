@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class LedModule(SmartModule):
     """Implementation of led controls."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "led"
     QUERY_GETTER_NAME = "get_led_info"
 
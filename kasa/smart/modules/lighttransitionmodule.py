@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class LightTransitionModule(SmartModule):
     """Implementation of gradual on/off."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "on_off_gradually"
     QUERY_GETTER_NAME = "get_on_off_gradually_info"
     MAXIMUM_DURATION = 60
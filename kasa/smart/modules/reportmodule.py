@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class ReportModule(SmartModule):
     """Implementation of report module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "report_mode"
     QUERY_GETTER_NAME = "get_report_mode"
 
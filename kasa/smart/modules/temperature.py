@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class TemperatureSensor(SmartModule):
     """Implementation of temperature module."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "temperature"
     QUERY_GETTER_NAME = "get_comfort_temp_config"
 
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 class TimeModule(SmartModule):
     """Implementation of device_local_time."""
 
+    __slots__ = ()
+
     REQUIRED_COMPONENT = "time"
     QUERY_GETTER_NAME = "get_device_time"
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
+
 from ..bulb import Bulb
 from ..exceptions import KasaException
 from ..iot.iotbulb import HSV, BulbPreset, ColorTempRange
@@ -11,6 +14,8 @@ AVAILABLE_EFFECTS = {
     "L1": "Party",
     "L2": "Relax",
 }
+_AVAILABLE_EFFECT_NAMES: tuple[str, ...] = tuple(AVAILABLE_EFFECTS)
+_NO_PRESETS: tuple[BulbPreset, ...] = ()
 
 
 class SmartBulb(SmartDevice, Bulb):
@@ -19,11 +24,23 @@ class SmartBulb(SmartDevice, Bulb):
     Documentation TBD. See :class:`~kasa.iot.Bulb` for now.
     """
 
+    def _update_internal_state(self, info):
+        """Update the internal info state and the values derived from it."""
+        super()._update_internal_state(info)
+        # TODO: this makes an assumption that only color bulbs report this
+        self._is_color = "hue" in info
+        self._effect: Mapping[str, Any] | None = None
+
+        # L900 reports [9000, 9000] even when it doesn't support changing the ct
+        ct = info.get("color_temp_range")
+        self._color_temp_range: ColorTempRange | None = (
+            ColorTempRange(*ct) if ct is not None and ct[0] != ct[1] else None
+        )
+
     @property
     def is_color(self) -> bool:
         """Whether the bulb supports color changes."""
-        # TODO: this makes an assumption that only color bulbs report this
-        return "hue" in self._info
+        return self._is_color
 
     @property
     def is_dimmable(self) -> bool:
@@ -33,9 +50,7 @@ class SmartBulb(SmartDevice, Bulb):
     @property
     def is_variable_color_temp(self) -> bool:
         """Whether the bulb supports color temperature changes."""
-        ct = self._info.get("color_temp_range")
-        # L900 reports [9000, 9000] even when it doesn't support changing the ct
-        return ct is not None and ct[0] != ct[1]
+        return self._color_temp_range is not None
 
     @property
     def valid_temperature_range(self) -> ColorTempRange:
@@ -43,11 +58,10 @@ class SmartBulb(SmartDevice, Bulb):
 
         :return: White temperature range in Kelvin (minimum, maximum)
         """
-        if not self.is_variable_color_temp:
+        if (ct_range := self._color_temp_range) is None:
             raise KasaException("Color temperature not supported")
 
-        ct_range = self._info.get("color_temp_range", [0, 0])
-        return ColorTempRange(min=ct_range[0], max=ct_range[1])
+        return ct_range
 
     @property
     def has_effects(self) -> bool:
@@ -55,10 +69,11 @@ class SmartBulb(SmartDevice, Bulb):
         return "dynamic_light_effect_enable" in self._info
 
     @property
-    def effect(self) -> dict:
+    def effect(self) -> Mapping[str, Any]:
         """Return effect state.
 
         This follows the format used by SmartLightStrip.
+        The returned mapping is read-only and rebuilt only after an update.
 
         Example:
             {'brightness': 50,
@@ -67,25 +82,28 @@ class SmartBulb(SmartDevice, Bulb):
              'id': '',
              'name': ''}
         """
-        # If no effect is active, dynamic_light_effect_id does not appear in info
-        current_effect = self._info.get("dynamic_light_effect_id", "")
-        data = {
-            "brightness": self.brightness,
-            "enable": current_effect != "",
-            "id": current_effect,
-            "name": AVAILABLE_EFFECTS.get(current_effect, ""),
-        }
+        if self._effect is None:
+            # If no effect is active, dynamic_light_effect_id does not appear in info
+            current_effect = self._info.get("dynamic_light_effect_id", "")
+            self._effect = MappingProxyType(
+                {
+                    "brightness": self.brightness,
+                    "enable": current_effect != "",
+                    "id": current_effect,
+                    "name": AVAILABLE_EFFECTS.get(current_effect, ""),
+                }
+            )
 
-        return data
+        return self._effect
 
     @property
-    def effect_list(self) -> list[str] | None:
+    def effect_list(self) -> tuple[str, ...] | None:
         """Return built-in effects list.
 
         Example:
-            ['Party', 'Relax', ...]
+            ('L1', 'L2', ...)
         """
-        return list(AVAILABLE_EFFECTS.keys()) if self.has_effects else None
+        return _AVAILABLE_EFFECT_NAMES if self.has_effects else None
 
     @property
     def hsv(self) -> HSV:
@@ -96,14 +114,13 @@ class SmartBulb(SmartDevice, Bulb):
         if not self.is_color:
             raise KasaException("Bulb does not support color.")
 
-        h, s, v = (
-            self._info.get("hue", 0),
-            self._info.get("saturation", 0),
-            self._info.get("brightness", 0),
+        info = self._info
+        return HSV(
+            hue=info.get("hue", 0),
+            saturation=info.get("saturation", 0),
+            value=info.get("brightness", 0),
         )
 
-        return HSV(hue=h, saturation=s, value=v)
-
     @property
     def color_temp(self) -> int:
         """Whether the bulb supports color temperature changes."""
@@ -140,17 +157,14 @@ class SmartBulb(SmartDevice, Bulb):
         if not self.is_color:
             raise KasaException("Bulb does not support color.")
 
-        if not isinstance(hue, int) or not (0 <= hue <= 360):
+        if not isinstance(hue, int) or not 0 <= hue <= 360:
             raise ValueError(f"Invalid hue value: {hue} (valid range: 0-360)")
 
-        if not isinstance(saturation, int) or not (0 <= saturation <= 100):
+        if not isinstance(saturation, int) or not 0 <= saturation <= 100:
             raise ValueError(
                 f"Invalid saturation value: {saturation} (valid range: 0-100%)"
             )
 
-        if value is not None:
-            self._raise_for_invalid_brightness(value)
-
         request_payload = {
             "color_temp": 0,  # If set, color_temp takes precedence over hue&sat
             "hue": hue,
@@ -158,9 +172,10 @@ class SmartBulb(SmartDevice, Bulb):
         }
         # The device errors on invalid brightness values.
         if value is not None:
+            self._raise_for_invalid_brightness(value)
             request_payload["brightness"] = value
 
-        return await self.protocol.query({"set_device_info": {**request_payload}})
+        return await self.protocol.query({"set_device_info": request_payload})
 
     async def set_color_temp(
         self, temp: int, *, brightness=None, transition: int | None = None
@@ -187,7 +202,8 @@ class SmartBulb(SmartDevice, Bulb):
 
         return await self.protocol.query({"set_device_info": {"color_temp": temp}})
 
-    def _raise_for_invalid_brightness(self, value: int):
+    @staticmethod
+    def _raise_for_invalid_brightness(value: int):
         """Raise error on invalid brightness value."""
         if not isinstance(value, int) or not (1 <= value <= 100):
             raise ValueError(f"Invalid brightness value: {value} (valid range: 1-100%)")
@@ -222,6 +238,6 @@ class SmartBulb(SmartDevice, Bulb):
         raise NotImplementedError()
 
     @property
-    def presets(self) -> list[BulbPreset]:
+    def presets(self) -> Sequence[BulbPreset]:
         """Return a list of available bulb setting presets."""
-        return []
+        return _NO_PRESETS
@@ -111,7 +111,7 @@ class SmartDevice(Device):
         # during the initialization, which is necessary as some information like the
         # supported color temperature range is contained within the response.
         self._last_update.update(resp)
-        self._info = self._try_get_response(resp, "get_device_info")
+        self._update_internal_state(self._try_get_response(resp, "get_device_info"))
 
         # Create our internal presentation of available components
         self._components_raw = resp["component_nego"]
@@ -140,7 +140,7 @@ class SmartDevice(Device):
 
         self._last_update = resp = await self.protocol.query(req)
 
-        self._info = self._try_get_response(resp, "get_device_info")
+        self._update_internal_state(self._try_get_response(resp, "get_device_info"))
         if child_info := self._try_get_response(resp, "get_child_device_list", {}):
             # TODO: we don't currently perform queries on children based on modules,
             #  but just update the information that is returned in the main query.
@@ -318,7 +318,8 @@ class SmartDevice(Device):
     def _update_internal_state(self, info):
         """Update the internal info state.
 
-        This is used by the parent to push updates to its children.
+        This is used by the parent to push updates to its children,
+        and by the device itself whenever new device info is received.
         """
         self._info = info
 
@@ -364,7 +365,7 @@ class SmartDevice(Device):
     def update_from_discover_info(self, info):
         """Update state from info from the discover call."""
         self._discovery_info = info
-        self._info = info
+        self._update_internal_state(info)
 
     async def get_emeter_realtime(self) -> EmeterStatus:
         """Retrieve current energy readings."""
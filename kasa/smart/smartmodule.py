@@ -17,6 +17,8 @@ _LOGGER = logging.getLogger(__name__)
 class SmartModule(Module):
     """Base class for SMART modules."""
 
+    __slots__ = ()
+
     NAME: str
     REQUIRED_COMPONENT: str
     QUERY_GETTER_NAME: str
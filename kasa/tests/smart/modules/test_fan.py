@@ -1,6 +1,6 @@
 from pytest_mock import MockerFixture
 
-from kasa import SmartDevice
+from kasa import Device
 from kasa.smart.modules import FanModule
 from kasa.tests.device_fixtures import parametrize
 
@@ -10,7 +10,7 @@ fan = parametrize(
 
 
 @fan
-async def test_fan_speed(dev: SmartDevice, mocker: MockerFixture):
+async def test_fan_speed(dev: Device, mocker: MockerFixture):
     """Test fan speed feature."""
     fan: FanModule = dev.modules["FanModule"]
     level_feature = fan._module_features["fan_speed_level"]
@@ -20,9 +20,9 @@ async def test_fan_speed(dev: SmartDevice, mocker: MockerFixture):
         <= level_feature.maximum_value
     )
 
-    call = mocker.spy(fan, "call")
+    call = mocker.spy(FanModule, "call")
     await fan.set_fan_speed_level(3)
-    call.assert_called_with("set_device_info", {"fan_sleep_level": 3})
+    call.assert_called_with(fan, "set_device_info", {"fan_sleep_level": 3})
 
     await dev.update()
 
@@ -31,15 +31,15 @@ async def test_fan_speed(dev: SmartDevice, mocker: MockerFixture):
 
 
 @fan
-async def test_sleep_mode(dev: SmartDevice, mocker: MockerFixture):
+async def test_sleep_mode(dev: Device, mocker: MockerFixture):
     """Test sleep mode feature."""
     fan: FanModule = dev.modules["FanModule"]
     sleep_feature = fan._module_features["fan_sleep_mode"]
     assert isinstance(sleep_feature.value, bool)
 
-    call = mocker.spy(fan, "call")
+    call = mocker.spy(FanModule, "call")
     await fan.set_sleep_mode(True)
-    call.assert_called_with("set_device_info", {"fan_sleep_mode_on": True})
+    call.assert_called_with(fan, "set_device_info", {"fan_sleep_mode_on": True})
 
     await dev.update()
 
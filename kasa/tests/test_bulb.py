@@ -9,10 +9,12 @@ from voluptuous import (
 
 from kasa import Bulb, BulbPreset, DeviceType, KasaException
 from kasa.iot import IotBulb
+from kasa.smart import SmartBulb
 
 from .conftest import (
     bulb,
     bulb_iot,
+    bulb_smart,
     color_bulb,
     color_bulb_iot,
     dimmable,
@@ -253,6 +255,23 @@ async def test_ignore_default_not_set_without_color_mode_change_turn_on(
     assert args[2] == {"on_off": 0, "ignore_default": 1}
 
 
+@bulb_smart
+async def test_smart_bulb_effect(dev: SmartBulb):
+    if not dev.has_effects:
+        pytest.skip("Bulb does not support effects")
+
+    effect = dev.effect
+    assert dev.effect is effect
+    assert effect["brightness"] == dev.brightness
+    with pytest.raises(TypeError):
+        effect["brightness"] = 1  # type: ignore[index]
+
+    await dev.set_brightness(10)
+    await dev.update()
+    assert dev.effect is not effect
+    assert dev.effect["brightness"] == 10
+
+
 @bulb_iot
 async def test_list_presets(dev: IotBulb):
     presets = dev.presets
@@ -1,8 +1,11 @@
 """Tests for all devices."""
 
 import importlib
+import importlib.metadata
 import inspect
+import os
 import pkgutil
+import subprocess
 import sys
 from unittest.mock import Mock, patch
 
@@ -49,6 +52,25 @@ async def test_alias(dev):
     assert dev.alias == original
 
 
+async def test_modules_have_slots(dev):
+    """Make sure all modules define __slots__ to avoid per-instance dicts."""
+    for module in dev.modules.values():
+        assert not hasattr(module, "__dict__"), type(module)
+
+
+async def test_module_repr_follows_host(dev):
+    """Make sure the cached module representation is updated on host change."""
+    if not dev.modules:
+        pytest.skip("Device has no modules")
+    module = next(iter(dev.modules.values()))
+    original_host = dev.host
+    assert repr(module).endswith(f" for {original_host}>")
+
+    dev.host = "127.0.0.42"
+    assert repr(module).endswith(" for 127.0.0.42>")
+    dev.host = original_host
+
+
 @device_classes
 async def test_device_class_ctors(device_class_name_obj):
     """Make sure constructor api not broken for new and existing SmartDevices."""
@@ -100,7 +122,10 @@ async def test_create_thin_wrapper():
 @pytest.mark.parametrize(
     "device_class, use_class", kasa.deprecated_smart_devices.items()
 )
-def test_deprecated_devices(device_class, use_class):
+def test_deprecated_devices(device_class, use_class, monkeypatch):
+    monkeypatch.delitem(vars(kasa), device_class, raising=False)
+    module_path, class_name = use_class
+    use_class = getattr(importlib.import_module(module_path), class_name)
     package_name = ".".join(use_class.__module__.split(".")[:-1])
     msg = f"{device_class} is deprecated, use {use_class.__name__} from package {package_name} instead"
     with pytest.deprecated_call(match=msg):
@@ -115,8 +140,55 @@ def test_deprecated_devices(device_class, use_class):
 @pytest.mark.parametrize(
     "exceptions_class, use_class", kasa.deprecated_exceptions.items()
 )
-def test_deprecated_exceptions(exceptions_class, use_class):
+def test_deprecated_exceptions(exceptions_class, use_class, monkeypatch):
+    monkeypatch.delitem(vars(kasa), exceptions_class, raising=False)
     msg = f"{exceptions_class} is deprecated, use {use_class.__name__} instead"
     with pytest.deprecated_call(match=msg):
         getattr(kasa, exceptions_class)
     getattr(kasa, use_class.__name__)
+
+
+def test_deprecated_warns_once(monkeypatch, recwarn):
+    monkeypatch.delitem(vars(kasa), "SmartDeviceException", raising=False)
+    with pytest.deprecated_call():
+        cls = kasa.SmartDeviceException
+    recwarn.clear()
+    assert kasa.SmartDeviceException is cls
+    assert not recwarn.list
+
+
+def test_version():
+    assert kasa.__version__ == importlib.metadata.version("python-kasa")
+    assert "__version__" in vars(kasa)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'NotExisting'"):
+        kasa.NotExisting  # noqa: B018
+
+
+def test_lazy_imports():
+    """Test that heavy submodules are only imported on first access."""
+    code = (
+        "import sys, kasa;"
+        "assert 'kasa.discover' not in sys.modules;"
+        "assert 'kasa.iot' not in sys.modules;"
+        "assert kasa.Discover.__module__ == 'kasa.discover';"
+        "assert 'Discover' in vars(kasa);"
+        "assert 'Discover' in dir(kasa)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+@pytest.mark.parametrize(("value", "eager"), [("1", True), ("0", False), ("", False)])
+def test_eager_imports(value, eager):
+    """Test that KASA_EAGER_IMPORT=1 resolves all lazy names on import."""
+    code = (
+        "import sys, kasa;"
+        f"assert ('kasa.discover' in sys.modules) is {eager};"
+        f"assert ('kasa.smart' in sys.modules) is {eager};"
+        f"assert ('Discover' in vars(kasa)) is {eager};"
+        f"assert ('smart' in vars(kasa)) is {eager}"
+    )
+    env = {**os.environ, "KASA_EAGER_IMPORT": value}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
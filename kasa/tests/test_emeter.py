@@ -173,3 +173,63 @@ async def test_emeter_daily():
         {"day": now.day, "energy_wh": 500, "month": now.month, "year": now.year}
     )
     assert emeter.emeter_today == 0.500
+
+
+async def test_emeter_today_and_month(mocker):
+    """Test that today's and this month's usage share a single clock read."""
+    now = datetime.datetime.now()
+    emeter_data = {
+        "get_daystat": {
+            "day_list": [{"day": now.day, "energy_wh": 500, "month": now.month}],
+            "err_code": 0,
+        },
+        "get_monthstat": {
+            "month_list": [{"month": now.month, "energy_wh": 1500}],
+            "err_code": 0,
+        },
+    }
+
+    class MockEmeter(Emeter):
+        @property
+        def data(self):
+            return emeter_data
+
+    emeter = MockEmeter(Mock(), "emeter")
+    dt = mocker.patch("kasa.iot.modules.emeter.datetime", wraps=datetime.datetime)
+    dt.now.return_value = now
+    assert emeter.emeter_today_and_month == (0.5, 1.5)
+    assert dt.now.call_count == 1
+
+
+def test_emeter_get_stat_value():
+    """Test looking up a single day/month entry with both energy formats."""
+    emeter = Emeter(Mock(), "emeter")
+    wh_data = [{"day": 1, "energy_wh": 8}, {"day": 2, "energy_wh": 500}]
+    assert emeter._get_stat_value(wh_data, "day", 2) == 0.5
+    assert emeter._get_stat_value(wh_data, "day", 2, kwh=False) == 500
+    assert emeter._get_stat_value(wh_data, "day", 3) is None
+
+    kwh_data = [{"month": 1, "energy": 0.5}]
+    assert emeter._get_stat_value(kwh_data, "month", 1) == 0.5
+    assert emeter._get_stat_value(kwh_data, "month", 1, kwh=False) == 500
+    assert emeter._get_stat_value([], "month", 1) is None
+
+
+@pytest.mark.parametrize(
+    "days",
+    [
+        pytest.param([1, 2, 3, 4], id="dense"),
+        pytest.param([2, 5, 9, 10], id="sparse"),
+        pytest.param([10, 4, 9, 2, 5], id="unordered"),
+    ],
+)
+def test_emeter_find_entry(days):
+    """Test finding entries both by offset and by searching the list."""
+    data = [{"day": day, "energy_wh": day * 10} for day in days]
+    for day in days:
+        assert Emeter._find_entry(data, "day", day) == {
+            "day": day,
+            "energy_wh": day * 10,
+        }
+    assert Emeter._find_entry(data, "day", 1 if 1 not in days else 31) is None
+    assert Emeter._find_entry([], "day", 1) is None
@@ -1,6 +1,7 @@
 import pytest
 
-from kasa import Feature, FeatureType
+from kasa import Feature, FeatureType, KasaException
+from kasa.module import Module
 
 
 @pytest.fixture
@@ -77,3 +78,23 @@ async def test_feature_setter_read_only(dummy_feature):
     dummy_feature.attribute_setter = None
     with pytest.raises(ValueError):
         await dummy_feature.set_value("value for read only feature")
+
+
+def test_module_feature_slugified_name(dummy_feature: Feature):
+    """Test that module features are keyed by their slugified name."""
+
+    class DummyModule(Module):
+        def query(self):
+            return {}
+
+        @property
+        def data(self):
+            return {}
+
+    module = DummyModule(dummy_feature.device, "dummy")
+    dummy_feature.name = "Dummy user's Feature"
+    module._add_feature(dummy_feature)
+    assert module._module_features == {"dummy_user_s_feature": dummy_feature}
+
+    with pytest.raises(KasaException, match="Duplicate name detected"):
+        module._add_feature(dummy_feature)
@@ -1,6 +1,10 @@
+from copy import deepcopy
+from typing import Mapping
+
 import pytest
 
 from kasa import DeviceType
+from kasa.effects import EFFECT_MAPPING_V1, EFFECTS_LIST_V1
 from kasa.exceptions import KasaException
 from kasa.iot import IotLightStrip
 
@@ -16,10 +20,16 @@ async def test_lightstrip_length(dev: IotLightStrip):
 
 @lightstrip
 async def test_lightstrip_effect(dev: IotLightStrip):
-    assert isinstance(dev.effect, dict)
+    assert isinstance(dev.effect, Mapping)
+    with pytest.raises(TypeError):
+        dev.effect["name"] = "foo"  # type: ignore[index]
     for k in ["brightness", "custom", "enable", "id", "name"]:
         assert k in dev.effect
 
+    assert dev.effect is dev.effect
+    await dev.update()
+    assert dev.effect == dev.sys_info["lighting_effect_state"]
+
 
 @lightstrip
 async def test_effects_lightstrip_set_effect(dev: IotLightStrip):
@@ -66,6 +76,26 @@ async def test_effects_lightstrip_set_effect_transition(
     assert payload["transition"] == transition
 
 
+@lightstrip
+async def test_effects_lightstrip_set_effect_keeps_defaults(dev: IotLightStrip, mocker):
+    query_helper = mocker.patch("kasa.iot.IotLightStrip._query_helper")
+    original = deepcopy(dict(EFFECT_MAPPING_V1["Candy Cane"]))
+
+    await dev.set_effect("Candy Cane", brightness=10, transition=10)
+    payload = query_helper.call_args_list[0][0][2]
+    assert payload["brightness"] == 10
+    assert payload["transition"] == 10
+    assert EFFECT_MAPPING_V1["Candy Cane"] == original
+
+    await dev.set_effect("Candy Cane")
+    payload = query_helper.call_args_list[1][0][2]
+    assert isinstance(payload, dict)
+    assert payload == original
+
+    with pytest.raises(TypeError):
+        EFFECT_MAPPING_V1["Candy Cane"]["brightness"] = 10  # type: ignore[index]
+
+
 @lightstrip
 async def test_effects_lightstrip_has_effects(dev: IotLightStrip):
     assert dev.has_effects is True
@@ -75,3 +105,16 @@ async def test_effects_lightstrip_has_effects(dev: IotLightStrip):
 @lightstrip
 def test_device_type_lightstrip(dev):
     assert dev.device_type == DeviceType.LightStrip
+
+
+def test_effect_mapping_is_detached(monkeypatch):
+    """Test that mutating the exported effect lists leaves the mapping intact."""
+    aurora = EFFECTS_LIST_V1[0]
+    assert aurora["name"] == "Aurora"
+    expected = deepcopy(aurora)
+
+    monkeypatch.setitem(aurora, "brightness", 1)
+    assert EFFECT_MAPPING_V1["Aurora"] == expected
+    assert EFFECT_MAPPING_V1["Aurora"]["sequence"] is not aurora["sequence"]
+    with pytest.raises(TypeError):
+        EFFECT_MAPPING_V1["Aurora"]["brightness"] = 1  # type: ignore[index]
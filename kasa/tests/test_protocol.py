@@ -11,6 +11,8 @@ import sys
 
 import pytest
 
+import kasa
+
 from ..aestransport import AesTransport
 from ..credentials import Credentials
 from ..deviceconfig import DeviceConfig
@@ -605,7 +607,8 @@ async def test_protocol_will_retry_on_write(
     assert write_mock.call_count == expected_call_count
 
 
-def test_deprecated_protocol():
+def test_deprecated_protocol(monkeypatch):
+    monkeypatch.delitem(vars(kasa), "TPLinkSmartHomeProtocol", raising=False)
     with pytest.deprecated_call():
         from kasa import TPLinkSmartHomeProtocol
 